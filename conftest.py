@@ -26,3 +26,17 @@ PYTEST_HEADER_MODULES.pop('h5py', None)
 PYTEST_HEADER_MODULES.pop('Pandas', None)
 
 TESTED_VERSIONS['stsynphot'] = version
+
+
+def pytest_addoption(parser, pluginmanager):
+    # ci-watson (test extra) provides --slow and the slow marker;
+    # only add them when running without it.
+    if not pluginmanager.hasplugin('ci_watson'):
+        parser.addoption('--slow', action='store_true', default=False,
+                         help='run slow tests, e.g., commissioning tests')
+
+
+def pytest_configure(config):
+    if not config.pluginmanager.hasplugin('ci_watson'):
+        config.addinivalue_line(
+            'markers', 'slow: slow test that only runs with --slow option')
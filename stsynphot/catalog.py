@@ -2,6 +2,7 @@
 """This module handles :ref:`catalog spectra <stsynphot-spec-atlas>`."""
 
 # STDLIB
+import copy
 import numbers
 
 # THIRD-PARTY
@@ -25,12 +26,14 @@ __all__ = ['reset_cache', 'get_catalog_index', 'grid_to_spec',
 
 _PARAM_NAMES = ['T_eff', 'metallicity', 'log_g']
 _CACHE = {}  # Stores grid look-up parameters to reduce file I/O.
+_SPCACHE = {}  # Stores grid spectra to reduce file I/O.
 
 
 def reset_cache():
-    """Empty the catalog grid cache."""
-    global _CACHE
+    """Empty the catalog grid and spectrum caches."""
+    global _CACHE, _SPCACHE
     _CACHE.clear()
+    _SPCACHE.clear()
 
 
 def _par_from_parser(x):
@@ -71,21 +74,33 @@ def _break_list(in_list, index, parameter):
 
 
 def _get_spectrum(parlist, catdir):
-    """Get list of spectra for given parameter list and base name."""
+    """Get list of spectra for given parameter list and base name.
+    Valid spectrum is cached and a copy of it is returned.
+
+    """
+    global _SPCACHE
+
     name = parlist[3]
 
     filename = name.split('[')[0]
     column = name.split('[')[1][:-1]
 
     filename = stio.resolve_filename(catdir, *filename.split('/'))
-    sp = SourceSpectrum.from_file(filename, flux_col=column)
+    key = (filename, column)
 
-    totflux = sp.integrate()
-    try:
-        validate_totalflux(totflux)
-    except synexceptions.SynphotError:
-        raise exceptions.ParameterOutOfBounds(
-            f"Parameter '{parlist}' has no valid data.")
+    if key not in _SPCACHE:
+        sp = SourceSpectrum.from_file(filename, flux_col=column)
+
+        totflux = sp.integrate()
+        try:
+            validate_totalflux(totflux)
+        except synexceptions.SynphotError:
+            raise exceptions.ParameterOutOfBounds(
+                f"Parameter '{parlist}' has no valid data.")
+
+        _SPCACHE[key] = sp
+
+    sp = copy.deepcopy(_SPCACHE[key])
 
     result = [member for member in parlist]
     result.pop()
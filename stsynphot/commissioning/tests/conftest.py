@@ -0,0 +1,91 @@
+"""Shared fixtures for commissioning tests."""
+
+# STDLIB
+import os
+import shutil
+
+# THIRD-PARTY
+import pytest
+from astropy.utils.data import get_pkg_data_filename
+
+# LOCAL
+from stsynphot.commissioning.utils import CommCase
+
+# Local test data
+datafiles = ['earthshine.fits', 'el1215a.fits', 'el1302a.fits', 'el1356a.fits',
+             'el2471a.fits', 'Zodi.fits']
+
+
+def pytest_configure(config):
+    # Also register the marker from pytest-xdist so it is known without it.
+    config.addinivalue_line(
+        'markers', 'xdist_group(name): run tests in same group on same worker')
+
+
+def pytest_collection_modifyitems(config, items):
+    # Skip before any class is set up, so skipped cases cost nothing.
+    if config.getoption('--slow', default=False):
+        return
+
+    skip_slow = pytest.mark.skip(reason='need --slow option to run')
+    for item in items:
+        if 'slow' in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope='session')
+def stage_data(tmp_path_factory):
+    """Stage test data in a temporary directory, so ``parse_spec`` works
+    properly for both ``stsynphot`` and ASTROLIB PYSYNPHOT when run from
+    there. Symbolic or hard links are used where possible to avoid
+    copying data. Staging is done only once per session and shared by
+    all the commissioning test modules.
+
+    """
+    data_dir = os.path.dirname(
+        get_pkg_data_filename(os.path.join('data', datafiles[0])))
+    work_dir = str(tmp_path_factory.mktemp('data'))
+
+    for datafile in datafiles:
+        src = os.path.join(data_dir, datafile)
+        dst = os.path.join(work_dir, datafile)
+        try:
+            os.symlink(src, dst)
+        except OSError:  # e.g., no symlink privilege on Windows
+            try:
+                os.link(src, dst)
+            except OSError:  # e.g., cross-device or unsupported
+                shutil.copyfile(src, dst)
+
+    return work_dir
+
+
+@pytest.fixture(scope='module', autouse=True)
+def work_dir(stage_data):
+    """Run each commissioning test module from the staged data directory
+    and restore the working directory afterwards.
+
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(stage_data)
+        yield stage_data
+
+
+@pytest.fixture(scope='class', autouse=True)
+def case(request):
+    """Set up ``CommCase`` subclass for the ``(obsmode, spectrum, force)``
+    given by :func:`stsynphot.commissioning.utils.parametrize_cases`.
+    Do nothing for a subclass that defines them as class variables.
+
+    """
+    if hasattr(request, 'param'):
+        cls = request.cls
+        cls.obsmode, cls.spectrum, cls.force = request.param
+        cls._setup_case()
+
+
+@pytest.fixture(scope='module', autouse=True)
+def reset_tables():
+    """Reset the tables set by ``CommCase`` once after each test module."""
+    yield
+    CommCase.reset_tables()
@@ -10,17 +10,19 @@ Adapted from ``astrolib/pysynphot/from_commissioning/acs/test3.py``
 """
 
 # LOCAL
-from stsynphot.commissioning.utils import CommCase
-
-
-class Test619(CommCase):
-    obsmode = 'acs,sbc,f115lp'
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'
-
-
-class Test620(Test619):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.5e-16,flam)'
-
-
-class Test621(Test619):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
+from stsynphot.commissioning.utils import CommCase, parametrize_cases
+
+# (test_id, obsmode, spectrum) for each test case
+CASES = [
+    ('Test619', 'acs,sbc,f115lp',
+     'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'),
+    ('Test620', 'acs,sbc,f115lp',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.5e-16,flam)'),
+    ('Test621', 'acs,sbc,f115lp',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+]
+
+
+@parametrize_cases(CASES)
+class TestACSSBC(CommCase):
+    """ACS/SBC tests, set up once for each of the ``CASES``."""
@@ -13,585 +13,300 @@ Adapted from ``astrolib/pysynphot/from_commissioning/acs/test5.py``,
 
 """
 
-# STDLIB
-import os
-import shutil
-
-# THIRD-PARTY
-from astropy.utils.data import get_pkg_data_filename
-
 # LOCAL
-from stsynphot.commissioning.utils import CommCase
-
-# Local test data
-datafiles = ['earthshine.fits', 'el1215a.fits', 'el1302a.fits', 'el1356a.fits',
-             'el2471a.fits', 'Zodi.fits']
-
-
-def setup_module(module):
-    """Copy test data to working directory so ``parse_spec`` works
-    properly for both ``stsynphot`` and ASTROLIB PYSYNPHOT."""
-    for datafile in datafiles:
-        src = get_pkg_data_filename(os.path.join('data', datafile))
-        shutil.copyfile(src, datafile)
-
-
-def teardown_module(module):
-    """Clean up test data in working directory."""
-    for datafile in datafiles:
-        os.remove(datafile)
-
-
-class Test672(CommCase):
-    obsmode = 'acs,wfc1,f502n'
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test673(CommCase):
-    obsmode = 'acs,wfc1,f550m'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test674(Test673):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test675(Test673):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test676(Test673):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test677(Test673):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test678(CommCase):
-    obsmode = 'acs,wfc1,f555w'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test679(Test678):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test680(Test678):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test681(Test678):
-    spectrum = 'rn(bb(10000),band(johnson,v),20,vegamag)'
-
-
-class Test682(Test678):
-    spectrum = 'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),20,vegamag)'
-
-
-class Test683(Test678):
-    spectrum = 'rn(pl(4000.0,-1.0,flam),band(johnson,v),20,vegamag)'
-
-
-class Test684(Test678):
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'
-
-
-class Test685(Test678):
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'
-
-
-class Test686(Test678):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-# Duplicate of Test680 and syntax already tested in Test490
-# class Test687(Test678):
-#    spectrum = 'spec($PYSYN_CDBS/calspec/gd71_mod_005.fits)'
-
-
-class Test688(Test678):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test689(Test678):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test690(CommCase):
-    obsmode = 'acs,wfc1,f555w,pol_v'
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'
-
-
-class Test691(Test690):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test692(CommCase):
-    obsmode = 'acs,wfc1,f606w'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test693(Test692):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test694(Test692):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test695(Test692):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test696(Test692):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test697(CommCase):
-    obsmode = 'acs,wfc1,f625w'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test698(Test697):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test699(Test697):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test700(Test697):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test701(Test697):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test702(Test697):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test703(CommCase):
-    obsmode = 'acs,wfc1,f658n'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test704(Test703):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test705(Test703):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test706(Test703):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test707(Test703):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test708(CommCase):
-    obsmode = 'acs,wfc1,f660n'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test709(Test708):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test710(Test708):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test711(Test708):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test712(Test708):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test713(CommCase):
-    obsmode = 'acs,wfc1,f775w'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test714(Test713):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test715(Test713):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test716(Test713):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test717(Test713):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test718(CommCase):
-    obsmode = 'acs,wfc1,f814w'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test719(Test718):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test720(Test718):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test721(Test718):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test722(Test718):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test723(CommCase):
-    obsmode = 'acs,wfc1,f850lp'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test724(Test723):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test725(Test723):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test726(Test723):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test727(Test723):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test728(Test723):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test729(CommCase):
-    obsmode = 'acs,wfc1,f892n'
-    spectrum = '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'
-
-
-class Test730(Test729):
-    spectrum = '$PYSYN_CDBS/calspec/gd153_mod_004.fits'
-
-
-class Test731(Test729):
-    spectrum = '$PYSYN_CDBS/calspec/gd71_mod_005.fits'
-
-
-class Test732(Test729):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'
-
-
-class Test733(Test729):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
-
-
-class Test734(CommCase):
-    obsmode = 'acs,wfc1,fr1016n#10000'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test735(Test734):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test736(CommCase):
-    obsmode = 'acs,wfc1,fr388n#3880'
-    spectrum = 'em(3880.0,10.0,1.0E-16,flam)'
-
-
-class Test737(Test736):
-    spectrum = 'rn(bb(10000),band(johnson,v),20,vegamag)'
-
-
-class Test738(Test736):
-    spectrum = 'rn(icat(k93models,15400,0.0,3.9),band(johnson,v),15,vegamag)'
-
-
-class Test739(Test736):
-    spectrum = 'rn(icat(k93models,3500,0.0,4.6),band(johnson,v),15,vegamag)'
-
-
-class Test740(Test736):
-    spectrum = 'rn(icat(k93models,44500,0.0,5.0),band(johnson,v),15,vegamag)'
-
-
-class Test741(Test736):
-    spectrum = 'rn(icat(k93models,4850,0.0,1.1),band(johnson,v),15,vegamag)'
-
-
-class Test742(Test736):
-    spectrum = 'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),15,vegamag)'
-
-
-class Test743(Test736):
-    spectrum = 'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),20,vegamag)'
-
-
-class Test744(Test736):
-    spectrum = 'rn(pl(4000.0,-1.0,flam),band(johnson,v),20,vegamag)'
-
-
-class Test745(Test736):
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'
-
-
-class Test746(Test736):
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'
-
-
-# Duplicate of Test748 and syntax already tested in Test587
-# class Test747(Test736):
-#    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.E-15,flam)'
-
-
-class Test748(Test736):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test749(Test736):
-    spectrum = 'spec($PYSYN_CDBS/calspec/g191b2b_mod_004.fits)'
-
-
-class Test750(Test736):
-    spectrum = 'spec($PYSYN_CDBS/calspec/gd71_mod_005.fits)'
-
-
-class Test751(Test736):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test752(CommCase):
-    obsmode = 'acs,wfc1,fr388n#3881'
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'
-
-
-class Test753(Test752):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test754(CommCase):
-    obsmode = 'acs,wfc1,fr423n#4230'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test755(Test754):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test756(CommCase):
-    obsmode = 'acs,wfc1,fr459m#4590'
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'
-
-
-class Test757(Test756):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test758(CommCase):
-    obsmode = 'acs,wfc1,fr459m#4620'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test759(Test758):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test760(CommCase):
-    obsmode = 'acs,wfc1,fr462n#4620'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test761(Test760):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test762(CommCase):
-    obsmode = 'acs,wfc1,fr505n#5000'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test763(Test762):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test764(CommCase):
-    obsmode = 'acs,wfc1,fr551n#5500'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test765(Test764):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test766(CommCase):
-    obsmode = 'acs,wfc1,fr601n#6000'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test767(Test766):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test768(CommCase):
-    obsmode = 'acs,wfc1,fr647m#6470'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test769(Test768):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test770(CommCase):
-    obsmode = 'acs,wfc1,fr656n#6500'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test771(Test770):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test772(CommCase):
-    obsmode = 'acs,wfc1,fr716n#7100'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test773(Test772):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test774(CommCase):
-    obsmode = 'acs,wfc1,fr782n#7900'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test775(Test774):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test776(CommCase):
-    obsmode = 'acs,wfc1,fr853n#8500'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test777(Test776):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test778(CommCase):
-    obsmode = 'acs,wfc1,fr914m#9000'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test779(Test778):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test780(CommCase):
-    obsmode = 'acs,wfc1,fr931n#9300'
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'
-
-
-class Test781(Test780):
-    obsmode = 'acs,wfc1,fr931n#9300'
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test782(CommCase):
-    obsmode = 'acs,wfc1,g800l'
-    spectrum = 'em(6500.0,10.0,1.0E-16,flam)'
-
-
-class Test783(Test782):
-    spectrum = 'rn(bb(10000),band(johnson,v),20,vegamag)'
-
-
-class Test784(Test782):
-    spectrum = 'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),20,vegamag)'
-
-
-class Test785(Test782):
-    spectrum = 'rn(pl(4000.0,-1.0,flam),band(johnson,v),20,vegamag)'
-
-
-class Test786(Test782):
-    spectrum = 'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'
-
-
-class Test787(Test782):
-    spectrum = 'rn(unit(1.0,flam),box(5500.0,1.0),1.5e-16,flam)'
-
-
-class Test788(Test782):
-    spectrum = 'spec($PYSYN_CDBS/calspec/gd71_mod_005.fits)'
-
-
-class Test789(Test782):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)')
-
-
-class Test790(Test782):
-    spectrum = ('spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),'
-                'band(johnson,v),22.7,vegamag)+(spec(el1215a.fits)+'
-                'spec(el1302a.fits)+spec(el1356a.fits)+spec(el2471a.fits))')
+from stsynphot.commissioning.utils import CommCase, parametrize_cases
+
+# (test_id, obsmode, spectrum) for each test case
+CASES = [
+    ('Test672', 'acs,wfc1,f502n',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test673', 'acs,wfc1,f550m',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test674', 'acs,wfc1,f550m',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test675', 'acs,wfc1,f550m',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test676', 'acs,wfc1,f550m',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test677', 'acs,wfc1,f550m',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test678', 'acs,wfc1,f555w',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test679', 'acs,wfc1,f555w',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test680', 'acs,wfc1,f555w',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test681', 'acs,wfc1,f555w',
+     'rn(bb(10000),band(johnson,v),20,vegamag)'),
+    ('Test682', 'acs,wfc1,f555w',
+     'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),20,vegamag)'),
+    ('Test683', 'acs,wfc1,f555w',
+     'rn(pl(4000.0,-1.0,flam),band(johnson,v),20,vegamag)'),
+    ('Test684', 'acs,wfc1,f555w',
+     'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'),
+    ('Test685', 'acs,wfc1,f555w',
+     'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'),
+    ('Test686', 'acs,wfc1,f555w',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    # Duplicate of Test680 and syntax already tested in Test490
+    # ('Test687', 'acs,wfc1,f555w',
+    #  'spec($PYSYN_CDBS/calspec/gd71_mod_005.fits)'),
+    ('Test688', 'acs,wfc1,f555w',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test689', 'acs,wfc1,f555w',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test690', 'acs,wfc1,f555w,pol_v',
+     'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'),
+    ('Test691', 'acs,wfc1,f555w,pol_v',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test692', 'acs,wfc1,f606w',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test693', 'acs,wfc1,f606w',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test694', 'acs,wfc1,f606w',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test695', 'acs,wfc1,f606w',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test696', 'acs,wfc1,f606w',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test697', 'acs,wfc1,f625w',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test698', 'acs,wfc1,f625w',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test699', 'acs,wfc1,f625w',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test700', 'acs,wfc1,f625w',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test701', 'acs,wfc1,f625w',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test702', 'acs,wfc1,f625w',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test703', 'acs,wfc1,f658n',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test704', 'acs,wfc1,f658n',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test705', 'acs,wfc1,f658n',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test706', 'acs,wfc1,f658n',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test707', 'acs,wfc1,f658n',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test708', 'acs,wfc1,f660n',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test709', 'acs,wfc1,f660n',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test710', 'acs,wfc1,f660n',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test711', 'acs,wfc1,f660n',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test712', 'acs,wfc1,f660n',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test713', 'acs,wfc1,f775w',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test714', 'acs,wfc1,f775w',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test715', 'acs,wfc1,f775w',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test716', 'acs,wfc1,f775w',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test717', 'acs,wfc1,f775w',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test718', 'acs,wfc1,f814w',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test719', 'acs,wfc1,f814w',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test720', 'acs,wfc1,f814w',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test721', 'acs,wfc1,f814w',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test722', 'acs,wfc1,f814w',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test723', 'acs,wfc1,f850lp',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test724', 'acs,wfc1,f850lp',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test725', 'acs,wfc1,f850lp',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test726', 'acs,wfc1,f850lp',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test727', 'acs,wfc1,f850lp',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test728', 'acs,wfc1,f850lp',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test729', 'acs,wfc1,f892n',
+     '$PYSYN_CDBS/calspec/g191b2b_mod_004.fits'),
+    ('Test730', 'acs,wfc1,f892n',
+     '$PYSYN_CDBS/calspec/gd153_mod_004.fits'),
+    ('Test731', 'acs,wfc1,f892n',
+     '$PYSYN_CDBS/calspec/gd71_mod_005.fits'),
+    ('Test732', 'acs,wfc1,f892n',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1e-18,flam)'),
+    ('Test733', 'acs,wfc1,f892n',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+    ('Test734', 'acs,wfc1,fr1016n#10000',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test735', 'acs,wfc1,fr1016n#10000',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test736', 'acs,wfc1,fr388n#3880',
+     'em(3880.0,10.0,1.0E-16,flam)'),
+    ('Test737', 'acs,wfc1,fr388n#3880',
+     'rn(bb(10000),band(johnson,v),20,vegamag)'),
+    ('Test738', 'acs,wfc1,fr388n#3880',
+     'rn(icat(k93models,15400,0.0,3.9),band(johnson,v),15,vegamag)'),
+    ('Test739', 'acs,wfc1,fr388n#3880',
+     'rn(icat(k93models,3500,0.0,4.6),band(johnson,v),15,vegamag)'),
+    ('Test740', 'acs,wfc1,fr388n#3880',
+     'rn(icat(k93models,44500,0.0,5.0),band(johnson,v),15,vegamag)'),
+    ('Test741', 'acs,wfc1,fr388n#3880',
+     'rn(icat(k93models,4850,0.0,1.1),band(johnson,v),15,vegamag)'),
+    ('Test742', 'acs,wfc1,fr388n#3880',
+     'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),15,vegamag)'),
+    ('Test743', 'acs,wfc1,fr388n#3880',
+     'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),20,vegamag)'),
+    ('Test744', 'acs,wfc1,fr388n#3880',
+     'rn(pl(4000.0,-1.0,flam),band(johnson,v),20,vegamag)'),
+    ('Test745', 'acs,wfc1,fr388n#3880',
+     'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'),
+    ('Test746', 'acs,wfc1,fr388n#3880',
+     'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'),
+    # Duplicate of Test748 and syntax already tested in Test587
+    # ('Test747', 'acs,wfc1,fr388n#3880',
+    #  'rn(unit(1.0,flam),box(5500.0,1.0),1.E-15,flam)'),
+    ('Test748', 'acs,wfc1,fr388n#3880',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test749', 'acs,wfc1,fr388n#3880',
+     'spec($PYSYN_CDBS/calspec/g191b2b_mod_004.fits)'),
+    ('Test750', 'acs,wfc1,fr388n#3880',
+     'spec($PYSYN_CDBS/calspec/gd71_mod_005.fits)'),
+    ('Test751', 'acs,wfc1,fr388n#3880',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test752', 'acs,wfc1,fr388n#3881',
+     'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'),
+    ('Test753', 'acs,wfc1,fr388n#3881',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test754', 'acs,wfc1,fr423n#4230',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test755', 'acs,wfc1,fr423n#4230',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test756', 'acs,wfc1,fr459m#4590',
+     'rn(unit(1.0,flam),band(johnson,v),22,vegamag)'),
+    ('Test757', 'acs,wfc1,fr459m#4590',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test758', 'acs,wfc1,fr459m#4620',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test759', 'acs,wfc1,fr459m#4620',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test760', 'acs,wfc1,fr462n#4620',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test761', 'acs,wfc1,fr462n#4620',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test762', 'acs,wfc1,fr505n#5000',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test763', 'acs,wfc1,fr505n#5000',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test764', 'acs,wfc1,fr551n#5500',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test765', 'acs,wfc1,fr551n#5500',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test766', 'acs,wfc1,fr601n#6000',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test767', 'acs,wfc1,fr601n#6000',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test768', 'acs,wfc1,fr647m#6470',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test769', 'acs,wfc1,fr647m#6470',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test770', 'acs,wfc1,fr656n#6500',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test771', 'acs,wfc1,fr656n#6500',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test772', 'acs,wfc1,fr716n#7100',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test773', 'acs,wfc1,fr716n#7100',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test774', 'acs,wfc1,fr782n#7900',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test775', 'acs,wfc1,fr782n#7900',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test776', 'acs,wfc1,fr853n#8500',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test777', 'acs,wfc1,fr853n#8500',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test778', 'acs,wfc1,fr914m#9000',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test779', 'acs,wfc1,fr914m#9000',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test780', 'acs,wfc1,fr931n#9300',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.e-15,flam)'),
+    ('Test781', 'acs,wfc1,fr931n#9300',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test782', 'acs,wfc1,g800l',
+     'em(6500.0,10.0,1.0E-16,flam)'),
+    ('Test783', 'acs,wfc1,g800l',
+     'rn(bb(10000),band(johnson,v),20,vegamag)'),
+    ('Test784', 'acs,wfc1,g800l',
+     'rn(icat(k93models,5770,0.0,4.5),band(johnson,v),20,vegamag)'),
+    ('Test785', 'acs,wfc1,g800l',
+     'rn(pl(4000.0,-1.0,flam),band(johnson,v),20,vegamag)'),
+    ('Test786', 'acs,wfc1,g800l',
+     'rn(unit(1.0,flam),band(johnson,v),15,vegamag)'),
+    ('Test787', 'acs,wfc1,g800l',
+     'rn(unit(1.0,flam),box(5500.0,1.0),1.5e-16,flam)'),
+    ('Test788', 'acs,wfc1,g800l',
+     'spec($PYSYN_CDBS/calspec/gd71_mod_005.fits)'),
+    ('Test789', 'acs,wfc1,g800l',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)'),
+    ('Test790', 'acs,wfc1,g800l',
+     'spec(earthshine.fits)*0.5+rn(spec(Zodi.fits),band(johnson,v),22.7,'
+     'vegamag)+(spec(el1215a.fits)+spec(el1302a.fits)+spec(el1356a.fits)+'
+     'spec(el2471a.fits))'),
+]
+
+
+@parametrize_cases(CASES)
+class TestACSWFC(CommCase):
+    """ACS/WFC tests, set up once for each of the ``CASES``."""
@@ -1,42 +1,51 @@
 """Utility functions for commissioning tests."""
 
 # STDLIB
+import copy
+import importlib.util
 import os
 import sys
-from collections.abc import Sized
 
 # THIRD-PARTY
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-# ASTROLIB
-try:
-    import pysynphot as S
-    from pysynphot.spparser import parse_spec as old_parse_spec
-except ImportError:
-    HAS_PYSYNPHOT = False
-else:
-    HAS_PYSYNPHOT = True
-
 # LOCAL
 from synphot import Observation
 from stsynphot.config import conf
 from stsynphot.spectrum import band
 from stsynphot.spparser import parse_spec
 
+# ASTROLIB
+# This is only imported when a test case is set up, so that the cost of
+# importing it is not paid when all the tests are skipped anyway.
+HAS_PYSYNPHOT = importlib.util.find_spec('pysynphot') is not None
+S = None
+old_parse_spec = None
+
 use_pysynphot = pytest.mark.skipif('not HAS_PYSYNPHOT')
 
 # Currently, this is here because only commissioning tests are considered
 # slow. If there are slow tests in the core unit tests, we can move this
-# one level higher.
-try:
-    slow = pytest.mark.skipif(not pytest.config.getoption('--slow'),
-                              reason='need --slow option to run')
-except AttributeError:  # Not using pytest
-    slow = pytest.mark.skipif(True, reason='need --slow option to run')
+# one level higher. Tests with this marker are skipped unless pytest is run
+# with the --slow option (see stsynphot/commissioning/tests/conftest.py).
+slow = pytest.mark.slow
+
+__all__ = ['use_pysynphot', 'slow', 'count_outliers', 'parametrize_cases',
+           'CommCase', 'ThermCase']
+
+# Stores parsed source spectra from both software, keyed by spectrum string
+# and tables, so that the same expression is only parsed once per session.
+_SPECTRA = {}
+
+# Tables currently in use by both software, as set by CommCase, so that
+# cases sharing the same tables do not set and reset them every time.
+_TABLES = {}
 
-__all__ = ['use_pysynphot', 'slow', 'count_outliers', 'CommCase', 'ThermCase']
+# Stores bandpasses from both software, keyed by obsmode and tables,
+# so that the same bandpass is only constructed once per session.
+_BANDPASSES = {}
 
 
 def count_outliers(data, sigma=3.0):
@@ -65,6 +74,47 @@ def count_outliers(data, sigma=3.0):
     return np.count_nonzero(abs(data) > (data.mean() + sigma * data.std()))
 
 
+def parametrize_cases(cases, force=None):
+    """Class decorator to parametrize a `CommCase` subclass so that
+    it runs all its tests once for every given case, instead of
+    needing one subclass per case.
+
+    Each case is set up once via the class-scoped ``case`` fixture
+    in ``stsynphot/commissioning/tests/conftest.py``.
+
+    Parameters
+    ----------
+    cases : list of tuple
+        List of ``(test_id, obsmode, spectrum)``.
+
+    force : dict or `None`
+        Maps test ID to ``force`` value for `synphot.Observation`
+        (see ``CommCase.force``), if not `None`.
+
+    Returns
+    -------
+    decorator : func
+        Decorator for the test class.
+
+    """
+    if force is None:
+        force = {}
+
+    # Cases are grouped by obsmode so that pytest-xdist, if used with
+    # "--dist loadgroup", runs those sharing a bandpass on the same worker.
+    params = [pytest.param((obsmode, spectrum, force.get(test_id)),
+                           id=test_id,
+                           marks=pytest.mark.xdist_group(name=obsmode))
+              for test_id, obsmode, spectrum in cases]
+
+    def decorator(cls):
+        cls._parametrized = True
+        return pytest.mark.parametrize(
+            'case', params, indirect=True, scope='class')(cls)
+
+    return decorator
+
+
 @use_pysynphot
 @slow
 @pytest.mark.remote_data
@@ -73,6 +123,7 @@ class CommCase:
     obsmode = None  # Observation mode string
     spectrum = None  # SYNPHOT-like string to construct spectrum
     force = None
+    _parametrized = False  # See parametrize_cases()
 
     # Default tables are the latest available as of 2016-07-25.
     tables = {
@@ -80,81 +131,143 @@ class CommCase:
         'comptable': os.path.join('mtab$OLD_FILES', '07r1502nm_tmc.fits'),
         'thermtable': 'mtab$tae17277m_tmt.fits'}
 
-    def setup_class(self):
+    @classmethod
+    def setup_class(cls):
         """Subclass needs to define ``obsmode`` and ``spectrum``
-        class variables for this to work.
+        class variables for this to work, unless it is decorated
+        with :func:`parametrize_cases`.
 
         """
+        if cls._parametrized:  # Set up by case fixture instead
+            return
+        cls._setup_case()
+
+    @classmethod
+    def _setup_case(cls):
+        """Construct objects to compare for ``obsmode`` and ``spectrum``."""
+        global S, old_parse_spec
+
         if not HAS_PYSYNPHOT:
             raise ImportError(
                 'ASTROLIB PYSYNPHOT must be installed to run these tests')
 
+        if S is None:
+            import pysynphot as S
+            from pysynphot.spparser import parse_spec as old_parse_spec
+
         # Make sure both software use the same graph and component tables.
+        # Nothing to do if they are already in use from a previous case.
+
+        if _TABLES != cls.tables:
+            conf.graphtable = cls.tables['graphtable']
+            conf.comptable = cls.tables['comptable']
+            conf.thermtable = cls.tables['thermtable']
 
-        conf.graphtable = self.tables['graphtable']
-        conf.comptable = self.tables['comptable']
-        conf.thermtable = self.tables['thermtable']
+            S.setref(graphtable=cls.tables['graphtable'],
+                     comptable=cls.tables['comptable'],
+                     thermtable=cls.tables['thermtable'])
 
-        S.setref(graphtable=self.tables['graphtable'],
-                 comptable=self.tables['comptable'],
-                 thermtable=self.tables['thermtable'])
+            _TABLES.clear()
+            _TABLES.update(cls.tables)
 
         # Construct spectra for both software.
 
-        self.sp = parse_spec(self.spectrum)
-        self.bp = band(self.obsmode)
+        tables_key = tuple(sorted(cls.tables.items()))
+
+        key = (cls.spectrum, tables_key)
+        if key not in _SPECTRA:
+            _SPECTRA[key] = (parse_spec(cls.spectrum),
+                             old_parse_spec(cls.spectrum))
+        cls.sp, spref = _SPECTRA[key]
+
+        # ASTROLIB spectrum is converted in-place below, so use a copy.
+        cls.spref = copy.deepcopy(spref)
+
+        key = (cls.obsmode, tables_key)
+        if key not in _BANDPASSES:
+            _BANDPASSES[key] = (band(cls.obsmode), S.ObsBandpass(cls.obsmode))
+        cls.bp, bpref = _BANDPASSES[key]
+
+        # ASTROLIB bandpass is converted in-place below, so use a copy.
+        cls.bpref = copy.deepcopy(bpref)
 
         # Astropy version has no prior knowledge of instrument-specific
         # binset, so it has to be set explicitly.
-        if hasattr(self.bp, 'binset'):
-            self.obs = Observation(self.sp, self.bp, force=self.force,
-                                   binset=self.bp.binset)
+        if hasattr(cls.bp, 'binset'):
+            cls.obs = Observation(cls.sp, cls.bp, force=cls.force,
+                                  binset=cls.bp.binset)
         else:
-            self.obs = Observation(self.sp, self.bp, force=self.force)
+            cls.obs = Observation(cls.sp, cls.bp, force=cls.force)
 
         # Astropy version does not assume a default waveset
         # (you either have it or you don't). If there is no
         # waveset, no point comparing obs waveset against ASTROLIB.
-        if self.sp.waveset is None or self.bp.waveset is None:
-            self._has_obswave = False
+        # Wavesets are computed on access, so keep them for the tests.
+        cls._sp_wave = cls.sp.waveset
+        cls._bp_wave = cls.bp.waveset
+        if cls._sp_wave is None or cls._bp_wave is None:
+            cls._has_obswave = False
         else:
-            self._has_obswave = True
+            cls._has_obswave = True
 
-        self.spref = old_parse_spec(self.spectrum)
-        self.bpref = S.ObsBandpass(self.obsmode)
-        self.obsref = S.Observation(self.spref, self.bpref, force=self.force)
+        # Spectrum families with known differences between the software.
+        cls._has_bb = 'bb(' in cls.spectrum
+        cls._has_unit = 'unit(' in cls.spectrum
+
+        # See _evaluate()
+        cls._evaluated = {}
+
+        cls.obsref = S.Observation(cls.spref, cls.bpref, force=cls.force)
 
         # Ensure we are comparing in the same units
-        self.bpref.convert(self.bp._internal_wave_unit.name)
-        self.spref.convert(self.sp._internal_wave_unit.name)
-        self.spref.convert(self.sp._internal_flux_unit.name)
-        self.obsref.convert(self.obs._internal_wave_unit.name)
-        self.obsref.convert(self.obs._internal_flux_unit.name)
+        cls.bpref.convert(cls.bp._internal_wave_unit.name)
+        cls.spref.convert(cls.sp._internal_wave_unit.name)
+        cls.spref.convert(cls.sp._internal_flux_unit.name)
+        cls.obsref.convert(cls.obs._internal_wave_unit.name)
+        cls.obsref.convert(cls.obs._internal_flux_unit.name)
 
     @staticmethod
-    def _get_new_wave(sp):
+    def _get_new_wave(wave):
         """Astropy version does not assume a default waveset
         (you either have it or you don't). This is a convenience
-        method to duck-type ASTROLIB waveset behavior.
+        method to duck-type ASTROLIB waveset behavior for the
+        given waveset, which can be `None`.
         """
-        wave = sp.waveset
         if wave is None:
-            wave = conf.waveset_array
+            # Config value is a list, so only convert it once here.
+            wave = np.asarray(conf.waveset_array)
         else:
             wave = wave.value
         return wave
 
+    def _evaluate(self, name, func):
+        """Return ``func()``, evaluated only once per case under the
+        given name, so that the ``zero`` and ``nonzero`` variants
+        of a test share the same results."""
+        if name not in self._evaluated:
+            self._evaluated[name] = func()
+        return self._evaluated[name]
+
     def _assert_allclose(self, actual, desired, rtol=1e-07,
                          atol=sys.float_info.min):
         """``assert_allclose`` only report percentage but we
         also want to know some extra info conveniently."""
-        if isinstance(actual, Sized):
-            ntot = len(actual)
-        else:
-            ntot = 1
+        # Plain comparison for scalar results like countrate.
+        if (np.isscalar(actual) and np.isscalar(desired) and
+                abs(actual - desired) <= atol + rtol * abs(desired)):
+            return
+
+        ntot = np.size(actual)
 
-        n = np.count_nonzero(
-            abs(actual - desired) > atol + rtol * abs(desired))
+        # Nothing else to do if all pass. NaN never passes here,
+        # so it is left to assert_allclose.
+        diff = abs(actual - desired)
+        tol = atol + rtol * abs(desired)
+        if (np.shape(actual) == np.shape(desired) and
+                np.count_nonzero(diff <= tol) == ntot):
+            return
+
+        n = np.count_nonzero(diff > tol)
         msg = (f'obsmode: {self.obsmode}\n'
                f'spectrum: {self.spectrum}\n'
                f'(mismatch {n}/{ntot})')
@@ -165,7 +278,8 @@ class CommCase:
     #       small non-zero flux values like 1.8e-26 to 2e-311.
     def _compare_nonzero(self, new, old, thresh=0.01, atol=1e-29):
         """Compare normally when results from both are non-zero."""
-        i = (new != 0) & (old != 0)
+        i = new != 0
+        i &= old != 0
 
         # Make sure non-zero atol is not too high, otherwise just let it fail.
         if atol > (thresh * min(new.max(), old.max())):
@@ -176,7 +290,9 @@ class CommCase:
     def _compare_zero(self, new, old, thresh=0.01):
         """Special handling for comparison when one of the results
         is zero. This is because ``rtol`` will not work."""
-        i = ((new == 0) | (old == 0)) & (new != old)
+        i = new == 0
+        i |= old == 0
+        i &= new != old
         try:
             self._assert_allclose(new[i], old[i], rtol=thresh)
         except AssertionError as e:
@@ -184,21 +300,21 @@ class CommCase:
 
     def test_band_wave(self, thresh=0.01):
         """Test bandpass waveset."""
-        wave = self._get_new_wave(self.bp)
+        wave = self._get_new_wave(self._bp_wave)
         self._assert_allclose(wave, self.bpref.wave, rtol=thresh)
 
     def test_spec_wave(self, thresh=0.01):
         """Test source spectrum waveset."""
-        wave = self._get_new_wave(self.sp)
+        wave = self._get_new_wave(self._sp_wave)
 
         # TODO: Failure due to different wavesets for blackbody; Ignore?
         try:
             self._assert_allclose(wave, self.spref.wave, rtol=thresh)
         except (AssertionError, ValueError):
             self._has_obswave = False  # Skip obs waveset tests
-            if 'bb(' in self.spectrum:
+            if self._has_bb:
                 pytest.xfail('Blackbody waveset implementations are different')
-            elif 'unit(' in self.spectrum:
+            elif self._has_unit:
                 pytest.xfail('Flat does not use default waveset anymore')
             else:
                 raise
@@ -215,9 +331,9 @@ class CommCase:
         try:
             self._assert_allclose(wave, self.obsref.wave, rtol=thresh)
         except (AssertionError, ValueError):
-            if 'bb(' in self.spectrum:
+            if self._has_bb:
                 pytest.xfail('Blackbody waveset implementations are different')
-            elif 'unit(' in self.spectrum:
+            elif self._has_unit:
                 self._has_obswave = False  # Skip binned flux test
                 pytest.xfail('Flat does not use default waveset anymore')
             else:
@@ -230,36 +346,39 @@ class CommCase:
     @pytest.mark.parametrize('thrutype', ['zero', 'nonzero'])
     def test_band_thru(self, thrutype, thresh=0.01):
         """Test bandpass throughput, which is always between 0 and 1."""
-        wave = self.bpref.wave
-        thru = self.bp(wave).value
+        thru, thruref = self._evaluate(
+            'band_thru',
+            lambda: (self.bp(self.bpref.wave).value, self.bpref.throughput))
 
         if thrutype == 'zero':
-            self._compare_zero(thru, self.bpref.throughput, thresh=thresh)
+            self._compare_zero(thru, thruref, thresh=thresh)
         else:  # nonzero
-            self._compare_nonzero(thru, self.bpref.throughput, thresh=thresh)
+            self._compare_nonzero(thru, thruref, thresh=thresh)
 
     @pytest.mark.parametrize('fluxtype', ['zero', 'nonzero'])
     def test_spec_flux(self, fluxtype, thresh=0.01):
         """Test flux for source spectrum in PHOTLAM."""
-        wave = self.spref.wave
-        flux = self.sp(wave).value
+        flux, fluxref = self._evaluate(
+            'spec_flux',
+            lambda: (self.sp(self.spref.wave).value, self.spref.flux))
 
         if fluxtype == 'zero':
-            self._compare_zero(flux, self.spref.flux, thresh=thresh)
+            self._compare_zero(flux, fluxref, thresh=thresh)
         else:  # nonzero
-            self._compare_nonzero(flux, self.spref.flux, thresh=thresh)
+            self._compare_nonzero(flux, fluxref, thresh=thresh)
 
     @pytest.mark.parametrize('fluxtype', ['zero', 'nonzero'])
     def test_obs_flux(self, fluxtype, thresh=0.01):
         """Test flux for observation in PHOTLAM."""
-        wave = self.obsref.wave
-        flux = self.obs(wave).value
+        flux, fluxref = self._evaluate(
+            'obs_flux',
+            lambda: (self.obs(self.obsref.wave).value, self.obsref.flux))
 
         # Native
         if fluxtype == 'zero':
-            self._compare_zero(flux, self.obsref.flux, thresh=thresh)
+            self._compare_zero(flux, fluxref, thresh=thresh)
         else:  # nonzero
-            self._compare_nonzero(flux, self.obsref.flux, thresh=thresh)
+            self._compare_nonzero(flux, fluxref, thresh=thresh)
 
         if not self._has_obswave:  # Do not compare binned flux
             return
@@ -273,7 +392,7 @@ class CommCase:
                 self._compare_nonzero(binflux, self.obsref.binflux,
                                       thresh=thresh)
             except AssertionError as e:
-                if 'unit(' in self.spectrum:
+                if self._has_unit:
                     pytest.xfail('Flat does not use default waveset anymore:\n'
                                  f'{repr(e)}')
                 else:
@@ -294,20 +413,30 @@ class CommCase:
         val = self.obs.effective_wavelength().value
         self._assert_allclose(val, ans, rtol=thresh)
 
-    def teardown_class(self):
-        """Reset config for both software."""
-        for cfgname in self.tables:
+    @staticmethod
+    def reset_tables():
+        """Reset config for both software, if changed by any case.
+
+        This is done once per test module by the ``reset_tables`` fixture
+        in ``stsynphot/commissioning/tests/conftest.py``, not after
+        every case.
+
+        """
+        if not _TABLES:
+            return
+
+        for cfgname in _TABLES:
             conf.reset(cfgname)
 
         S.setref()
+        _TABLES.clear()
 
 
 class ThermCase(CommCase):
     """Commissioning tests with thermal component."""
 
-    @pytest.mark.parametrize('fluxtype', ['zero', 'nonzero'])
-    def test_therm_spec(self, fluxtype, thresh=0.01):
-        """Test bandpass thermal spectrum."""
+    def _get_therm_flux(self):
+        """Thermal spectrum fluxes from both software."""
         thspref = self.bpref.obsmode.ThermalSpectrum()
         thsp = self.bp.obsmode.thermal_spectrum()
 
@@ -316,13 +445,19 @@ class ThermCase(CommCase):
         thspref.convert(thsp._internal_flux_unit.name)
 
         # waveset not expected to be same here, so just compare flux
-        flux = thsp(thspref.wave).value
+        return thsp(thspref.wave).value, thspref.flux
+
+    @pytest.mark.parametrize('fluxtype', ['zero', 'nonzero'])
+    def test_therm_spec(self, fluxtype, thresh=0.01):
+        """Test bandpass thermal spectrum."""
+        flux, fluxref = self._evaluate('therm_spec', self._get_therm_flux)
+
         if fluxtype == 'zero':
-            self._compare_zero(flux, thspref.flux, thresh=thresh)
+            self._compare_zero(flux, fluxref, thresh=thresh)
         else:  # nonzero
             # TODO: Is the refactored version really better?
             try:
-                self._compare_nonzero(flux, thspref.flux, thresh=thresh)
+                self._compare_nonzero(flux, fluxref, thresh=thresh)
             except AssertionError:
                 pytest.xfail('New thermal spectrum samples better')
 
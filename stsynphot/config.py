@@ -14,7 +14,6 @@ directories to be configured properly. It also overwrites
 import os
 
 # THIRD-PARTY
-import numpy as np
 from astropy import log
 from astropy.config import ConfigNamespace, ConfigItem
 
@@ -52,6 +51,10 @@ class Conf(ConfigNamespace):
     # Telescope primary mirror collecting area in cm^2
     area = ConfigItem(45238.93416, 'Telescope collecting area in cm^2')
 
+    # Number of threads to read component files
+    load_threads = ConfigItem(
+        1, 'Number of threads to read component files, 1 reads serially')
+
     # Common filter name
     clear_filter = ConfigItem('clear', 'Name for a clear filter')
 
@@ -90,7 +93,7 @@ def overwrite_synphot_config(root):
         Root directory name.
 
     """
-    subdir_keys = ['calspec', 'extinction', 'nonhst']
+    subdir_keys = ('calspec', 'extinction', 'nonhst')
 
     # Need this for Windows support
     if root.startswith(('http', 'ftp')):
@@ -101,12 +104,12 @@ def overwrite_synphot_config(root):
     for cfgitem in _get_synphot_cfgitems():
         path, fname = os.path.split(cfgitem())
 
-        i = np.where(list(map(path.__contains__, subdir_keys)))[0]
-        if len(i) == 0:
+        for subdir in subdir_keys:
+            if subdir in path:
+                break
+        else:
             continue
 
-        subdir = subdir_keys[i[0]]
-
         if subdir == 'nonhst':
             cfgval = sep.join([root, 'comp', subdir, fname])
         else:
@@ -145,7 +148,7 @@ def getref():
     refdict : dict
 
     """
-    return dict([x for x in _get_ref_cfgitems()])
+    return dict(_get_ref_cfgitems())
 
 
 def showref():  # pragma: no cover
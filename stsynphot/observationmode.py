@@ -4,6 +4,7 @@
 # STDLIB
 import re
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 # THIRD-PARTY
 import numpy as np
@@ -40,14 +41,21 @@ _COMPDICT = {}
 _THERMDICT = {}
 _DETECTORDICT = {}
 
+# Cache previously loaded optical and thermal components
+_COMPONENTDICT = {}
+_THCOMPDICT = {}
+
 
 def reset_cache():
-    """Empty the table dictionaries cache."""
+    """Empty the table and component dictionaries cache."""
     global _GRAPHDICT, _COMPDICT, _THERMDICT, _DETECTORDICT
+    global _COMPONENTDICT, _THCOMPDICT
     _GRAPHDICT.clear()
     _COMPDICT.clear()
     _THERMDICT.clear()
     _DETECTORDICT.clear()
+    _COMPONENTDICT.clear()
+    _THCOMPDICT.clear()
 
 
 class Component:
@@ -138,6 +146,27 @@ class ThermalComponent(Component):
         return str(self.emissivity)
 
 
+def _load_components(cdict, cdict_keys, component_class):
+    """Load and cache components that are not in cache yet.
+    Component files are read serially, unless
+    ``stsynphot.config.conf.load_threads`` allows more threads.
+
+    """
+    missing = [key for key in dict.fromkeys(cdict_keys) if key not in cdict]
+
+    def load(key):
+        return component_class(*key[:-1], interpval=key[-1])
+
+    n_threads = min(conf.load_threads, len(missing))
+
+    if n_threads > 1:
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            cdict.update(zip(missing, executor.map(load, missing)))
+    else:
+        for key in missing:
+            cdict[key] = load(key)
+
+
 def _process_graphtable(graphtable):
     """Load and cache graphtable. Get primary area."""
     global _GRAPHDICT
@@ -183,6 +212,10 @@ class BaseObservationMode:
 
         ``binset`` is set by ``stsynphot.wavetable.WAVECAT``.
 
+        ``components``, ``binset``, and ``bandwave`` are only loaded
+        when first accessed, so errors from reading the files are
+        also raised then. They can still be assigned to directly.
+
     Parameters
     ----------
     obsmode : str
@@ -270,27 +303,40 @@ class BaseObservationMode:
             ct = CompTable(self.ctname)
             _COMPDICT[self.ctname] = ct
 
-        # Set by sub-classes
-        self.components = None
-
         # Get optical component filenames
         self._throughput_filenames = ct.get_filenames(self.compnames)
 
-        # Set detector pixel scale
-        self._set_pixscale()
+        # Set detector pixel scale from instrument and detector modes
+        self._set_pixscale(','.join(modes[:2]))
 
         # For sensitivity calculations
         self._constant = self.primary_area / units.HC
 
-        # Get wavelength set
+    @lazyproperty
+    def components(self):
+        """List of component objects, set by subclasses."""
+        return None
+
+    @lazyproperty
+    def _wavecat_entry(self):
+        """Wavelength table string and set, loaded on first access."""
         try:
-            self.binset, self.bandwave = WAVECAT.load_waveset(self._obsmode)
+            return WAVECAT.load_waveset(self._obsmode)
         except (KeyError, exceptions.AmbiguousObsmode):
-            self.binset = ''
-            self.bandwave = None
+            return '', None
+
+    @lazyproperty
+    def binset(self):
+        """Wavelength table filename/param string from matching obsmode."""
+        return self._wavecat_entry[0]
 
-    def _set_pixscale(self):
-        """Set pixel scale.
+    @lazyproperty
+    def bandwave(self):
+        """Wavelength set defined by ``binset``."""
+        return self._wavecat_entry[1]
+
+    def _set_pixscale(self, obsmode):
+        """Set pixel scale for given instrument and detector obsmode.
         If multiple matches found, only first match is used.
 
         """
@@ -298,19 +344,21 @@ class BaseObservationMode:
 
         det_file = stio.irafconvert(conf.detectorfile)
 
+        # Load and cache pixel scales by obsmode, if not in cache
         if det_file in _DETECTORDICT:
-            data = _DETECTORDICT[det_file]
+            pixscales = _DETECTORDICT[det_file]
         else:
             data = stio.read_detector_pars(det_file)
-            _DETECTORDICT[det_file] = data
-
-        obsmode = ','.join(self._obsmode.split(',')[:2])
-        pixscales = data[data['OBSMODE'] == obsmode]['SCALE'].data
+            pixscales = {}
+            for det_obsmode, scale in zip(data['OBSMODE'],
+                                          data['SCALE'].data):
+                pixscales.setdefault(det_obsmode, scale)
+            _DETECTORDICT[det_file] = pixscales
 
-        if pixscales.size < 1:
+        if obsmode not in pixscales:
             self.pixscale = None
         else:
-            self.pixscale = pixscales[0] * u.arcsec
+            self.pixscale = pixscales[obsmode] * u.arcsec
 
     def _get_components(self):
         raise NotImplementedError('To be implemented by subclasses.')
@@ -358,20 +406,34 @@ class ObservationMode(BaseObservationMode):
     obsmode, graphtable, comptable
         See `BaseObservationMode`.
 
-    component_dict : dict
+    component_dict : dict or `None`
         Maps component filename to corresponding `Component`.
+        If `None`, previously loaded components are reused from cache.
 
     """
     def __init__(self, obsmode, graphtable=None, comptable=None,
-                 component_dict={}):
+                 component_dict=None):
+        global _COMPONENTDICT
+
         super(ObservationMode, self).__init__(
             obsmode, graphtable=graphtable, comptable=comptable)
-        self._component_dict = component_dict
-        self.components = self._get_components()
+
+        if component_dict is None:
+            self._component_dict = _COMPONENTDICT
+        else:
+            self._component_dict = component_dict
+
+    @lazyproperty
+    def components(self):
+        """List of component objects, loaded on first access."""
+        return self._get_components()
 
     def _get_components(self):
-        """Get optical components."""
-        components = []
+        """Get optical components.
+        Previously loaded components are reused from cache.
+
+        """
+        cdict_keys = []
 
         for throughput_name in self._throughput_filenames:
             parkey = self._parkey_from_filename(throughput_name)
@@ -380,12 +442,13 @@ class ObservationMode(BaseObservationMode):
             if parkey == 'wave' and self.modes[0] == 'wfpc2':
                 parkey = 'lrf'
 
-            cdict_key = (throughput_name, self.pardict.get(parkey))
+            cdict_keys.append((throughput_name, self.pardict.get(parkey)))
+
+        _load_components(self._component_dict, cdict_keys, Component)
 
-            if cdict_key not in self._component_dict:
-                self._component_dict[cdict_key] = Component(
-                    cdict_key[0], interpval=cdict_key[1])
+        components = []
 
+        for cdict_key in cdict_keys:
             component = self._component_dict[cdict_key]
 
             if not component.empty:
@@ -394,14 +457,24 @@ class ObservationMode(BaseObservationMode):
         return components
 
     def _mul_thru(self, index):
-        """Multiply all component spectra starting at given index."""
-        product = self.components[index].throughput
-
-        if len(self.components) > index:
-            for component in self.components[index + 1:]:
-                if not component.empty:
-                    product = product * component.throughput
+        """Multiply all component spectra starting at given index.
+        Spectra are multiplied pairwise, so the compound model is
+        balanced instead of one level deeper per component.
 
+        """
+        thrus = [self.components[index].throughput]
+        thrus += [component.throughput
+                  for component in self.components[index + 1:]
+                  if not component.empty]
+
+        while len(thrus) > 1:
+            products = [thrus[i] * thrus[i + 1]
+                        for i in range(0, len(thrus) - 1, 2)]
+            if len(thrus) % 2:
+                products.append(thrus[-1])
+            thrus = products
+
+        product = thrus[0]
         product.meta['header'] = ''  # Clean up messy header
         return product
 
@@ -426,8 +499,10 @@ class ObservationMode(BaseObservationMode):
 
         """
         x = self.throughput.waveset
-        y = self.throughput(x)
-        thru = y.value * x.value * self._constant.value
+        # Multiply in place; same operation order as y * x * constant
+        thru = self.throughput(x).value
+        thru *= x.value
+        thru *= self._constant.value
         meta = {'expr': f'Sensitivity for {self._obsmode}'}
         return SpectralElement(
             Empirical1D, points=x, lookup_table=thru, meta=meta)
@@ -500,7 +575,8 @@ class ThermalObservationMode(BaseObservationMode):
 
         # Check here to see if there are any valid filters.
         # "0.0" was added in tae17277m_tmt.fits (Apr 2017).
-        if set(self.thcompnames).issubset(set([conf.clear_filter, '', '0.0'])):
+        no_thermal = (conf.clear_filter, '', '0.0')
+        if all(thcompname in no_thermal for thcompname in self.thcompnames):
             raise NotImplementedError(
                 f'No thermal support provided for {self._obsmode}')
 
@@ -520,17 +596,33 @@ class ThermalObservationMode(BaseObservationMode):
         # Get thermal component filenames
         self._thermal_filenames = thct.get_filenames(self.thcompnames)
 
-        self.components = self._get_components()
+    @lazyproperty
+    def components(self):
+        """List of component objects, loaded on first access."""
+        return self._get_components()
 
     def _get_components(self):
-        """Get thermal components."""
-        components = []
+        """Get thermal components.
+        Previously loaded components are reused from cache.
+
+        """
+        global _THCOMPDICT
+
+        cdict_keys = []
 
         for throughput_name, thermal_name in zip(
                 self._throughput_filenames, self._thermal_filenames):
             parkey = self._parkey_from_filename(throughput_name)
-            component = ThermalComponent(throughput_name, thermal_name,
-                                         interpval=self.pardict.get(parkey))
+            cdict_keys.append((throughput_name, thermal_name,
+                               self.pardict.get(parkey)))
+
+        _load_components(_THCOMPDICT, cdict_keys, ThermalComponent)
+
+        components = []
+
+        for cdict_key in cdict_keys:
+            component = _THCOMPDICT[cdict_key]
+
             if not component.empty:
                 components.append(component)
 
@@ -541,22 +633,14 @@ class ThermalObservationMode(BaseObservationMode):
 
     def _merge_em_wave(self):
         """Merge emissivity wavelength sets in Angstrom."""
-        index = 1
+        wavesets = [component.emissivity.waveset.value
+                    for component in self.components
+                    if component.emissivity is not None]
+        result = wavesets[0]
 
-        # Find first wavelength set
-        for component in self.components:
-            emissivity = component.emissivity
-            if emissivity is None:
-                index += 1
-            else:
-                result = emissivity.waveset.value
-                break
-
-        # Merge subsequent wavelength sets
-        for component in self.components[index:]:
-            emissivity = component.emissivity
-            if emissivity is not None:
-                result = merge_wavelengths(result, emissivity.waveset.value)
+        # Merge subsequent wavelength sets all at once
+        if len(wavesets) > 1:
+            result = merge_wavelengths(result, np.concatenate(wavesets[1:]))
 
         return result
 
@@ -606,27 +690,43 @@ class ThermalObservationMode(BaseObservationMode):
             Thermal spectrum in PHOTLAM.
 
         """
-        # Create zero-flux spectrum
+        # Create zero-flux spectrum, sampled as arrays until the end.
+        # Optical throughputs are applied at the next thermal section.
         x = self._get_wave_intersection()  # Angstrom
         y = np.zeros_like(x, dtype=np.float64)  # PHOTLAM
         minw, maxw = x[([0, -1], )]
-        sp = SourceSpectrum(Empirical1D, points=x, lookup_table=y)
+        thrus = []
 
         for component in self.components:
             # Transmissive section (optical passband)
             if component.throughput is not None:
-                sp = sp * component.throughput
+                thrus.append(component.throughput)
 
             # Thermal section
             if component.emissivity is not None:
-                sp = sp + component.emissivity.thermal_source()
+                thsp = component.emissivity.thermal_source()
+
+                # Merge wavelengths as the combined spectrum would
+                w = x
+                for thru in thrus:
+                    w = merge_wavelengths(w, thru.waveset.value)
+                w = merge_wavelengths(w, thsp.waveset.value)
 
                 # Trim spectrum
-                w = sp.waveset.value
                 mask = (w >= minw) & (w <= maxw)
-                x = w[mask]
-                y = sp(x)
-                sp = SourceSpectrum(Empirical1D, points=x, lookup_table=y)
+                w = w[mask]
+                y = np.interp(w, x, y)
+                for thru in thrus:
+                    y *= thru(w).value
+                y += thsp(w).value
+                x = w
+                thrus = []
+
+        sp = SourceSpectrum(Empirical1D, points=x, lookup_table=y)
+
+        # Throughputs after the last thermal section
+        for thru in thrus:
+            sp = sp * thru
 
         meta = {'expr': f'{self._obsmode} ThermalSpectrum'}
         sp.meta.update(meta)
@@ -295,6 +295,10 @@ class ObservationSpectralElement(SpectralElement):
             `True` if bounded by zeroes, `False` otherwise.
 
         """
+        # Only the end points of the default waveset need evaluating
+        if wavelengths is None and self.waveset is not None:
+            wavelengths = self.waveset[[0, -1]]
+
         thru = self(wavelengths)
         y = thru[::thru.size - 1].value
         bounded = np.all(y == 0)
@@ -491,7 +495,7 @@ class ObservationSpectralElement(SpectralElement):
 
     @classmethod
     def from_obsmode(cls, obsmode, graphtable=None, comptable=None,
-                     component_dict={}):
+                     component_dict=None):
         """Create a bandpass from observation mode string.
 
         Parameters
@@ -507,9 +511,10 @@ class ObservationSpectralElement(SpectralElement):
             Optical component table filename.
             If `None`, uses ``stsynphot.config.conf.comptable``.
 
-        component_dict : dict
+        component_dict : dict or `None`
             Maps component filename to corresponding
             `~stsynphot.observationmode.Component`.
+            If `None`, previously loaded components are reused from cache.
 
         Returns
         -------
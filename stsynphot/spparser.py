@@ -16,6 +16,11 @@ See :ref:`stsynphot-parser` for more details and
     IRAF SYNPHOT extinction names are obsolete and no longer supported.
 
 """
+# STDLIB
+import copy
+import functools
+import os
+
 # ASTROPY
 from astropy import log
 from astropy import units as u
@@ -36,7 +41,7 @@ from stsynphot.stio import irafconvert
 
 __all__ = ['Token', 'AST', 'BaseScanner', 'Scanner', 'BaseParser',
            'Interpreter', 'tokens_info', 'scan', 'parse', 'interpret',
-           'parse_spec']
+           'parse_spec', 'reset_cache']
 
 # IRAF SYNPHOT functions
 _SYFUNCTIONS = ('band', 'bb', 'box', 'ebmvx', 'em', 'icat', 'pl', 'rn', 'spec',
@@ -46,6 +51,38 @@ _SYFUNCTIONS = ('band', 'bb', 'box', 'ebmvx', 'em', 'icat', 'pl', 'rn', 'spec',
 _SYFORMS = ('abmag', 'counts', 'flam', 'fnu', 'jy', 'mjy', 'obmag', 'photlam',
             'photnu', 'stmag', 'vegamag')
 
+_SPECFILES = {}  # Stores source spectra read from files to reduce file I/O.
+_PARSER = None  # Stores parser so its rules are only built once.
+
+
+def reset_cache():
+    """Empty the source spectrum file and parsed command caches."""
+    global _SPECFILES
+    _SPECFILES.clear()
+    _parse_command.cache_clear()
+
+
+def _read_spec_file(filename):
+    """Read source spectrum from given file, using cache if available.
+
+    A copy is returned because the interpreter modifies the
+    spectrum it is given (e.g., metadata and redshift).
+
+    """
+    filename = irafconvert(filename)
+
+    # Local files modified since they were cached are read again
+    if '://' in filename:
+        key, mtime = filename, None
+    else:
+        key = os.path.abspath(filename)
+        mtime = (os.path.getmtime(filename) if os.path.isfile(filename)
+                 else None)
+
+    if key not in _SPECFILES or _SPECFILES[key][0] != mtime:
+        _SPECFILES[key] = (mtime, SourceSpectrum.from_file(filename))
+    return copy.deepcopy(_SPECFILES[key][1])
+
 
 def _convertstr(value):
     """Convert given filename to source spectrum or passband.
@@ -352,7 +389,7 @@ class Interpreter(GenericASTMatcher):
 
             # Source spectrum from file
             elif fname == 'spec':
-                tree.value = SourceSpectrum.from_file(irafconvert(args[0]))
+                tree.value = _read_spec_file(args[0])
                 tree.value.meta.update(metadata)
 
             # Passband
@@ -384,7 +421,7 @@ class Interpreter(GenericASTMatcher):
                 rnval = args[2] * fluxunit
 
                 if not isinstance(sp, SourceSpectrum):
-                    sp = SourceSpectrum.from_file(irafconvert(sp))
+                    sp = _read_spec_file(sp)
 
                 if not isinstance(bp, SpectralElement):
                     bp = SpectralElement.from_file(irafconvert(bp))
@@ -412,7 +449,7 @@ class Interpreter(GenericASTMatcher):
 
                 # ETC generates junk (i.e., 'null') sometimes
                 if isinstance(sp, str) and sp != 'null':
-                    sp = SourceSpectrum.from_file(irafconvert(sp))
+                    sp = _read_spec_file(sp)
 
                 if isinstance(sp, SourceSpectrum):
                     tree.value = sp
@@ -453,6 +490,7 @@ def tokens_info(tlist):  # pragma: no cover
 
 def scan(input_str):
     """Scan language string."""
+    # Scanner collects tokens in an instance attribute, so it is not shared
     scanner = Scanner()
     input_str = input_str.replace('%2b', '+')
     return scanner.tokenize(input_str)
@@ -460,8 +498,12 @@ def scan(input_str):
 
 def parse(tokens):
     """Parse tokens."""
-    parser = BaseParser(AST)
-    return parser.parse(tokens)
+    global _PARSER
+
+    if _PARSER is None:
+        _PARSER = BaseParser(AST)
+
+    return _PARSER.parse(tokens)
 
 
 def interpret(ast):
@@ -472,9 +514,22 @@ def interpret(ast):
     return _convertstr(value)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_command(syncommand):
+    """Scan and parse command, keeping the most recent ASTs in cache.
+    Cached AST must not be interpreted directly; see :func:`parse_spec`.
+
+    """
+    return parse(scan(syncommand))
+
+
 def parse_spec(syncommand):
     """Parse a classic SYNPHOT command and return the resulting spectrum.
 
+    The parsed ASTs of recent commands are cached by command string, so
+    only the interpretation is repeated for a command that was seen before.
+    See :func:`reset_cache`.
+
     Parameters
     ----------
     syncommand : str
@@ -486,4 +541,5 @@ def parse_spec(syncommand):
         Spectrum object.
 
     """
-    return interpret(parse(scan(syncommand)))
+    # Interpreter stores values in the AST, so cached AST is left untouched
+    return interpret(copy.deepcopy(_parse_command(syncommand)))
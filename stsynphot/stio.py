@@ -363,8 +363,8 @@ def read_graphtable(filename, tab_ext=1):
         primary_area = primary_area * units.AREA
 
     # Check for segmented graph table
-    if np.any([x.lower().endswith('graph')
-               for x in data['COMPNAME']]):  # pragma: no cover
+    if np.any(np.char.endswith(
+            np.char.lower(data['COMPNAME']), 'graph')):  # pragma: no cover
         raise synexceptions.SynphotError(
             'Segmented graph tables not supported.')
 
@@ -6,6 +6,7 @@ import numpy as np
 
 # ASTROPY
 from astropy import log
+from astropy.utils.decorators import lazyproperty
 
 # LOCAL
 from stsynphot import exceptions, stio
@@ -54,14 +55,29 @@ class GraphTable:
             tab_ext=ext)
 
         # Convert all strings to lowercase
-        self.keywords = np.array([s.lower() for s in data['KEYWORD']])
-        self.compnames = np.array([s.lower() for s in data['COMPNAME']])
-        self.thcompnames = np.array([s.lower() for s in data['THCOMPNAME']])
+        self.keywords = np.char.lower(data['KEYWORD'])
+        self.compnames = np.char.lower(data['COMPNAME'])
+        self.thcompnames = np.char.lower(data['THCOMPNAME'])
 
         # Already int
         self.innodes = data['INNODE']
         self.outnodes = data['OUTNODE']
 
+        # (compname, thcompname, outnode) of table rows for each input
+        # node, grouped by keyword, so that traversal does not search
+        # the whole table at every node.
+        entries = {}
+        columns = zip(self.innodes.tolist(), self.keywords.tolist(),
+                      self.compnames.tolist(), self.thcompnames.tolist(),
+                      self.outnodes.tolist())
+        for innode, keyword, *entry in columns:
+            entries.setdefault(innode, {}).setdefault(keyword, []).append(
+                tuple(entry))
+        self._innode_entries = entries
+
+        # Cache traversal results from get_comp_from_gt()
+        self._compcache = {}
+
     def get_next_node(self, modes, innode):
         """Return the output node that matches an element from
         given list of modes, starting at the given input node.
@@ -112,10 +128,13 @@ class GraphTable:
         """Return component names for the given modes by traversing
         the graph table, starting at the given input node.
 
+        Results are cached by modes and input node, so traversing
+        the same path again does not walk the graph table.
+
         .. note::
 
             Extra debug messages available by setting logger to
-            debug mode.
+            debug mode (only for the first traversal of a path).
 
         Parameters
         ----------
@@ -142,11 +161,22 @@ class GraphTable:
             Unused keyword in mode.
 
         """
+        key = (tuple(modes), innode)
+        if key not in self._compcache:
+            self._compcache[key] = self._traverse(modes, innode)
+        components, thcomponents = self._compcache[key]
+
+        # Return copies so the cached lists cannot be modified.
+        return list(components), list(thcomponents)
+
+    def _traverse(self, modes, innode):
+        """Walk the graph table for :meth:`get_comp_from_gt`."""
+        innode_entries = self._innode_entries  # Looked up on every hop
         components = []
         thcomponents = []
         outnode = 0
         inmodes = set(modes)
-        used_modes = set()
+        used_modes = []
         count = 0
 
         while outnode >= 0:
@@ -154,41 +184,37 @@ class GraphTable:
                 log.debug(f'outnode={outnode} (stop condition).')
 
             previous_outnode = outnode
-            nodes = np.where(self.innodes == innode)
 
             # If there are no entries with this innode, we're done
-            if len(nodes[0]) == 0:
+            if innode not in innode_entries:
                 log.debug(f'innode={innode} not found (stop condition).')
                 break
 
+            last_innode = innode
+            entries = innode_entries[innode]
+
             # Find the entry corresponding to the component named
             # 'default', because thats the one we'll use if we don't
             # match anything in the modes list
-            if 'default' in self.keywords[nodes]:
-                dfi = np.where(self.keywords[nodes] == 'default')[0][0]
-                outnode = self.outnodes[nodes[0][dfi]]
-                component = self.compnames[nodes[0][dfi]]
-                thcomponent = self.thcompnames[nodes[0][dfi]]
+            if 'default' in entries:
+                component, thcomponent, outnode = entries['default'][0]
                 used_default = True
             else:
                 # There's no default, so fail if nothing found in the
                 # keyword matching step.
                 outnode = -2
                 component = thcomponent = None
+                used_default = False
 
             # Match something from the modes list
             for mode in modes:
-                if mode in self.keywords[nodes]:
-                    used_modes.add(mode)
-                    index = np.where(self.keywords[nodes] == mode)
-                    n_match = len(index[0])
+                if mode in entries:
+                    used_modes.append(mode)
+                    n_match = len(entries[mode])
                     if n_match > 1:
                         raise exceptions.AmbiguousObsmode(
                             f'{n_match} matches found for {mode}')
-                    idx = index[0][0]
-                    component = self.compnames[nodes[0][idx]]
-                    thcomponent = self.thcompnames[nodes[0][idx]]
-                    outnode = self.outnodes[nodes[0][idx]]
+                    component, thcomponent, outnode = entries[mode][0]
                     used_default = False
 
             log.debug(f'innode={innode} outnode={outnode} '
@@ -208,12 +234,14 @@ class GraphTable:
 
         if outnode < 0:
             log.debug(f'outnode={outnode} (stop condition)')
+            nodes = np.where(self.innodes == last_innode)[0]
             raise exceptions.IncompleteObsmode(
                 f'{modes}, choose from {self.keywords[nodes]}')
 
-        if inmodes != used_modes:
-            raise exceptions.UnusedKeyword(
-                f'{str(inmodes.difference(used_modes))}')
+        # Every matched mode comes from modes, so only check leftovers
+        unused_modes = inmodes.difference(set(used_modes))
+        if unused_modes:
+            raise exceptions.UnusedKeyword(f'{str(unused_modes)}')
 
         return components, thcomponents
 
@@ -224,7 +252,7 @@ class CompTable:
     Table is parsed with :func:`~stsynphot.stio.read_comptable`.
     Only component names and filenames are kept.
     Component throughput filenames are parsed with
-    :func:`~stsynphot.stio.irafconvert`.
+    :func:`~stsynphot.stio.irafconvert` only when needed.
 
     Parameters
     ----------
@@ -251,9 +279,14 @@ class CompTable:
                          'SEVERELY crippled.')),
             tab_ext=ext)
         self.name = compfile
-        self.compnames = np.array([s.lower() for s in data['COMPNAME']])
-        self.filenames = np.array(
-            list(map(stio.irafconvert, data['FILENAME'])))
+        self.compnames = np.char.lower(data['COMPNAME'])
+        self._rawfilenames = np.asarray(data['FILENAME'])
+        self._filecache = {}  # Cache converted filenames by component name
+
+    @lazyproperty
+    def filenames(self):
+        """Converted filenames of all the components."""
+        return np.array(list(map(stio.irafconvert, self._rawfilenames)))
 
     def get_filenames(self, compnames):
         """Get filenames of given component names.
@@ -279,12 +312,17 @@ class CompTable:
         files = []
 
         for compname in compnames:
-            if compname not in (None, '', conf.clear_filter):
+            if compname in self._filecache:
+                files.append(self._filecache[compname])
+            elif compname not in (None, '', conf.clear_filter):
                 index = np.where(self.compnames == compname)[0]
                 if len(index) < 1:
                     raise exceptions.GraphtabError(
                         f'Cannot find {compname} in {self.name}.')
-                files.append(self.filenames[index[0]].lstrip())
+                filename = stio.irafconvert(
+                    self._rawfilenames[index[0]]).lstrip()
+                self._filecache[compname] = filename
+                files.append(filename)
             else:
                 files.append(conf.clear_filter)
 
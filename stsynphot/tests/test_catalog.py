@@ -67,10 +67,19 @@ def test_grid_to_spec():
     key = list(catalog._CACHE.keys())[0]
     assert key.endswith('grid/k93models/catalog.fits')
     assert isinstance(catalog._CACHE[key], list)
+    assert len(catalog._SPCACHE) > 0
+
+    # Cached grid spectra are not modified
+    sp2 = catalog.grid_to_spec('k93models', 6440, 0, 4.3)
+    sp2.meta['expr'] = 'foo'
+    sp3 = catalog.grid_to_spec('k93models', 6440, 0, 4.3)
+    assert sp3 is not sp2
+    assert sp3.meta['expr'] == sp.meta['expr']
 
     # Reset cache
     catalog.reset_cache()
     assert catalog._CACHE == {}
+    assert catalog._SPCACHE == {}
 
 
 @pytest.mark.remote_data
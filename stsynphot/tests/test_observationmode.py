@@ -14,6 +14,9 @@ from astropy.utils.data import get_pkg_data_filename
 
 # SYNPHOT
 from synphot import units
+from synphot.models import Empirical1D
+from synphot.spectrum import SourceSpectrum, SpectralElement
+from synphot.thermal import ThermalSpectralElement
 
 # LOCAL
 from stsynphot import observationmode
@@ -115,6 +118,61 @@ class TestProcessGraphTable:
         assert area2 == area
 
 
+class _FakeComponent:
+    """Component that records its arguments and fails on ``'bad'``."""
+    def __init__(self, *args, interpval=None):
+        if args[0] == 'bad':
+            raise ValueError('cannot read bad')
+        self.args = args
+        self.interpval = interpval
+
+
+@pytest.mark.parametrize('n_threads', [1, 4])
+class TestLoadComponents:
+    """Test component loading, serial and in threads."""
+    def test_order(self, n_threads):
+        cdict = {('cached', None): 'old'}
+        cdict_keys = [('a', 'x', None), ('cached', None), ('b', 'y', 1.0),
+                      ('c', 'z', None)]
+
+        with conf.set_temp('load_threads', n_threads):
+            observationmode._load_components(
+                cdict, cdict_keys, _FakeComponent)
+
+        assert list(cdict) == [('cached', None), ('a', 'x', None),
+                               ('b', 'y', 1.0), ('c', 'z', None)]
+        assert cdict[('cached', None)] == 'old'
+        for key in cdict_keys[:1] + cdict_keys[2:]:
+            assert cdict[key].args == key[:-1]
+            assert cdict[key].interpval == key[-1]
+
+    def test_duplicate(self, n_threads):
+        cdict = {}
+        cdict_keys = [('a', None), ('b', None), ('a', None)]
+        loaded = []
+
+        def load(*args, interpval=None):
+            loaded.append(args)
+            return _FakeComponent(*args, interpval=interpval)
+
+        with conf.set_temp('load_threads', n_threads):
+            observationmode._load_components(cdict, cdict_keys, load)
+
+        assert sorted(loaded) == [('a', ), ('b', )]
+        assert list(cdict) == [('a', None), ('b', None)]
+
+    def test_exception(self, n_threads):
+        cdict = {}
+        cdict_keys = [('a', None), ('bad', None), ('c', None)]
+
+        with conf.set_temp('load_threads', n_threads):
+            with pytest.raises(ValueError, match='cannot read bad'):
+                observationmode._load_components(
+                    cdict, cdict_keys, _FakeComponent)
+
+        assert ('bad', None) not in cdict
+
+
 @pytest.mark.remote_data
 class TestObservationMode:
     """Test observation mode."""
@@ -152,6 +210,10 @@ class TestObservationMode:
         for c in self.obsmode.components:
             assert not c.empty
 
+        # Components are cached
+        cached = list(observationmode._COMPONENTDICT.values())
+        assert all(c in cached for c in self.obsmode.components)
+
     def test_throughput(self):
         t = self.obsmode.throughput
         w = t.waveset[::1000]
@@ -182,6 +244,16 @@ class TestObservationMode:
         assert obsmode.pardict['aper'] == 0.3
         assert obsmode.pardict['fr459m'] == 4610
 
+    def test_lazy(self):
+        obsmode = observationmode.ObservationMode(
+            'acs,wfc1,f555w', graphtable=GT_FILE, comptable=CP_FILE)
+        assert 'components' not in obsmode.__dict__
+        assert '_wavecat_entry' not in obsmode.__dict__
+
+        # Loaded on first access
+        assert obsmode.binset.endswith('acs.dat')
+        assert len(obsmode) == len(obsmode.__dict__['components'])
+
     def test_thermal_spec(self):
         """Also see TestThermalObservationMode.
         Whitespace in obsmode should not matter.
@@ -216,6 +288,13 @@ class TestThermalObservationMode:
         th_key = list(observationmode._THERMDICT.keys())[0]
         assert th_key.endswith('tables_tmt.fits')
 
+        # Thermal components are reused
+        thmode2 = observationmode.ThermalObservationMode(
+            'wfc3,ir,f153m', graphtable=GT_FILE, comptable=CP_FILE,
+            thermtable=TH_FILE)
+        for c1, c2 in zip(self.thmode.components, thmode2.components):
+            assert c1 is c2
+
     def test_attributes(self):
         assert str(self.thmode) == 'wfc3,ir,f153m (thermal)'
 
@@ -251,6 +330,101 @@ class TestThermalObservationMode:
                 thermtable=TH_FILE)
 
 
+def _thermal_spectrum_per_component(components, x):
+    """Thermal spectrum built one spectrum object per component, as
+    ``ThermalObservationMode.to_spectrum`` did before sampling on arrays.
+
+    """
+    minw, maxw = x[([0, -1], )]
+    sp = SourceSpectrum(Empirical1D, points=x, lookup_table=np.zeros_like(x))
+
+    for component in components:
+        if component.throughput is not None:
+            sp = sp * component.throughput
+
+        if component.emissivity is not None:
+            sp = sp + component.emissivity.thermal_source()
+            w = sp.waveset.value
+            w = w[(w >= minw) & (w <= maxw)]
+            sp = SourceSpectrum(Empirical1D, points=w, lookup_table=sp(w))
+
+    return sp
+
+
+def test_thermal_to_spectrum_components(monkeypatch):
+    """Thermal spectrum sampled on arrays matches the one built
+    from spectrum objects, using synthetic components.
+
+    """
+    def make_component(throughput=None, emissivity=None):
+        component = observationmode.ThermalComponent(
+            conf.clear_filter, conf.clear_filter)
+        component.throughput = throughput
+        component.emissivity = emissivity
+        return component
+
+    def make_throughput(w, lo, hi):
+        return SpectralElement(
+            Empirical1D, points=w, lookup_table=np.linspace(lo, hi, w.size))
+
+    def make_emissivity(w, temperature, lo, hi):
+        return ThermalSpectralElement(
+            Empirical1D, temperature=temperature * u.K, points=w,
+            lookup_table=np.linspace(lo, hi, w.size))
+
+    w1 = np.arange(10000, 30001, 500, dtype=np.float64)  # Angstrom
+    w2 = np.arange(10250, 29751, 750, dtype=np.float64)
+    w3 = np.arange(9000, 31001, 1100, dtype=np.float64)
+    components = [
+        make_component(emissivity=make_emissivity(w1, 290, 0.05, 0.1)),
+        make_component(throughput=make_throughput(w2, 0.9, 0.95),
+                       emissivity=make_emissivity(w3, 270, 0.02, 0.03)),
+        make_component(throughput=make_throughput(w3, 0.97, 0.8)),
+        make_component(emissivity=make_emissivity(w2, 250, 0.1, 0.05)),
+        make_component(throughput=make_throughput(w1, 0.5, 0.6))]
+    x = np.arange(10500, 29501, 200, dtype=np.float64)
+
+    obsmode = observationmode.ThermalObservationMode.__new__(
+        observationmode.ThermalObservationMode)
+    obsmode._obsmode = 'synthetic'
+    obsmode.components = components
+    monkeypatch.setattr(obsmode, '_get_wave_intersection', lambda: x)
+
+    sp = obsmode.to_spectrum()
+    ans = _thermal_spectrum_per_component(components, x)
+    np.testing.assert_allclose(sp.waveset.value, ans.waveset.value)
+    np.testing.assert_allclose(
+        sp(ans.waveset).value, ans(ans.waveset).value, rtol=1e-10)
+    assert sp.meta['expr'] == 'synthetic ThermalSpectrum'
+
+
+def test_pixscale_whitespace():
+    """Whitespace in obsmode should not matter for pixel scale."""
+    obsmode = observationmode.ObservationMode(
+        'wfc3, ir, f153m', graphtable=GT_FILE, comptable=CP_FILE)
+    assert obsmode.pixscale == 0.128 * u.arcsec
+
+
+def test_lazy_assignable():
+    """Lazily loaded attributes can still be assigned to."""
+    obsmode = observationmode.ObservationMode(
+        'acs,wfc1,f555w', graphtable=GT_FILE, comptable=CP_FILE)
+    obsmode.binset = 'mybinset'
+    obsmode.bandwave = [1000, 2000] * u.AA
+    obsmode.components = []
+    assert '_wavecat_entry' not in obsmode.__dict__
+    assert obsmode.binset == 'mybinset'
+    np.testing.assert_array_equal(obsmode.bandwave.value, [1000, 2000])
+    assert len(obsmode) == 0
+
+    # Not set by base class
+    obsmode = observationmode.BaseObservationMode(
+        'acs,wfc1,f555w', graphtable=GT_FILE, comptable=CP_FILE)
+    assert obsmode.components is None
+
+
 def teardown_module():
     observationmode.reset_cache()
     assert observationmode._GRAPHDICT == {}
+    assert observationmode._COMPONENTDICT == {}
+    assert observationmode._THCOMPDICT == {}
@@ -139,6 +139,77 @@ def test_z_em():
     _compare_spectra(sp1, sp2)
 
 
+def test_spec_file_cache(tmpdir):
+    """Spectrum read from file is cached but not modified by interpreter."""
+    sp = SourceSpectrum(Empirical1D, points=[1000, 5000, 10000] * u.AA,
+                        lookup_table=[1, 2, 3] * units.PHOTLAM)
+    spparser.reset_cache()
+
+    with tmpdir.as_cwd():
+        sp.to_fits('myspec.fits')
+
+        sp1 = spparser.parse_spec('z(spec(myspec.fits), 0.1)')
+        assert len(spparser._SPECFILES) == 1
+        _single_functioncall(
+            sp1, SourceSpectrum, Empirical1D, None, ans_z=0.1)
+
+        sp2 = spparser.parse_spec('spec(myspec.fits)')
+        assert len(spparser._SPECFILES) == 1
+        _single_functioncall(
+            sp2, SourceSpectrum, Empirical1D, 'spec(myspec.fits)', ans_z=0)
+        _compare_spectra(sp2, sp)
+
+        # Modified file is read again
+        sp3 = SourceSpectrum(Empirical1D, points=[1000, 5000, 10000] * u.AA,
+                             lookup_table=[4, 5, 6] * units.PHOTLAM)
+        sp3.to_fits('myspec.fits', overwrite=True)
+        mtime = os.path.getmtime('myspec.fits') + 10
+        os.utime('myspec.fits', (mtime, mtime))
+        sp4 = spparser.parse_spec('spec(myspec.fits)')
+        assert len(spparser._SPECFILES) == 1
+        _compare_spectra(sp4, sp3)
+
+    spparser.reset_cache()
+    assert len(spparser._SPECFILES) == 0
+
+
+def test_ast_cache():
+    """Cached AST is interpreted into a new spectrum every time."""
+    spparser.reset_cache()
+    cmd = 'z(em(5000, 25, 1, flam), 0.1)'
+    sp1 = spparser.parse_spec(cmd)
+    sp2 = spparser.parse_spec(cmd)
+    cache_info = spparser._parse_command.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.currsize == 1
+    assert sp1 is not sp2
+    _compare_spectra(sp1, sp2)
+
+    # Interpreted values are not stored in cached AST
+    assert not hasattr(spparser._parse_command(cmd), 'value')
+
+    # Modifying one result does not affect the other
+    sp2.z = 0.2
+    assert sp1.z == 0.1
+
+    spparser.reset_cache()
+    assert spparser._parse_command.cache_info().currsize == 0
+
+
+def test_reuse_parser():
+    """Same parser is reused and gives the same result."""
+    tokens1 = spparser.scan('em(5000, 25, 1, flam) * 2')
+    ast1 = spparser.parse(tokens1)
+    parser = spparser._PARSER
+    tokens2 = spparser.scan('em(5000, 25, 1, flam) * 2')
+    ast2 = spparser.parse(tokens2)
+    assert spparser._PARSER is parser
+    assert tokens1 is not tokens2
+    assert len(tokens1) == len(tokens2) == 12
+    assert ast1 is not ast2
+    assert ast1 == ast2
+
+
 @pytest.mark.remote_data
 def test_remote_spec_vegafile():
     sp1 = spparser.parse_spec('spec(crcalspec$alpha_lyr_stis_007.fits)')
@@ -569,3 +640,4 @@ def teardown_module():
     catalog.reset_cache()
     observationmode.reset_cache()
     spectrum.reset_cache()
+    spparser.reset_cache()
@@ -171,6 +171,9 @@ class TestObservationSpectralElement:
             result = self.obs.bounded_by_zero(wavelengths=[5000, 6000])
         assert not result
 
+        # Default waveset end points
+        assert self.obs.bounded_by_zero()
+
     def test_other_graph_table(self):
         """Using the graph table with PRIMAREA."""
         gt_file = get_pkg_data_filename(
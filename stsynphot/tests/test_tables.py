@@ -57,6 +57,17 @@ class TestGraphTable:
              'wfc3_ir_mir2', 'wfc3_ir_csm', 'wfc3_ir_win', 'wfc3_ir_qe',
              'wfc3_ir_rcp', 'wfc3_ir_f098m', 'wfc3_ir_wmring']))
 
+    def test_comp_cache(self):
+        modes = ['wfc3', 'ir', 'f098m', 'mjd#']
+        comp, thcomp = self.gt.get_comp_from_gt(modes, 1)
+        assert (tuple(modes), 1) in self.gt._compcache
+        ans = comp[:], thcomp[:]
+
+        # Cached result is not affected by changes to returned lists.
+        comp.append('foo')
+        thcomp.clear()
+        assert self.gt.get_comp_from_gt(modes, 1) == ans
+
     def test_comp_exceptions(self):
         # Invalid innode
         with pytest.raises(exceptions.UnusedKeyword):
@@ -66,6 +77,10 @@ class TestGraphTable:
         with pytest.raises(exceptions.IncompleteObsmode):
             self.gt.get_comp_from_gt(['acs'], 1)
 
+        # Failed traversals are not cached
+        assert (('acs', ), 0) not in self.gt._compcache
+        assert (('acs', ), 1) not in self.gt._compcache
+
 
 class TestCompTable:
     """Test optical and thermal component tables."""
@@ -78,6 +93,12 @@ class TestCompTable:
         np.testing.assert_array_equal(files[:3], 'clear')
         assert files[3].endswith('wfc3_ir_mask_001_syn.fits')
 
+        # Converted filename is reused
+        assert self.ct._filecache['wfc3_ir_mask'] == files[3]
+        assert self.ct.get_filenames(['wfc3_ir_mask']) == files[3:]
+        i = np.where(self.ct.compnames == 'wfc3_ir_mask')[0][0]
+        assert self.ct.filenames[i] == files[3]
+
     def test_thermal_files(self):
         files = self.tt.get_filenames(['wfc3_ir_wmring'])
         assert files[0].endswith('wfc3_ir_wmring_001_th.fits')
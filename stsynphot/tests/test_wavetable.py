@@ -40,6 +40,13 @@ def test_load_waveset_file():
     assert wave.unit == u.AA
     np.testing.assert_allclose([wave.value[0], wave.value[-1]], [1000, 11000])
 
+    # Reloaded from cache, which is not affected by changes to the copy
+    wave[0] = 0 * u.AA
+    wave2 = WAVECAT.load_waveset('acs,wfc1,f555w')[1]
+    assert wave2 is not wave
+    np.testing.assert_allclose(
+        [wave2.value[0], wave2.value[-1]], [1000, 11000])
+
 
 @pytest.mark.parametrize(
     ('obsmode', 'ncoeff', 'ans'),
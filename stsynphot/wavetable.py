@@ -43,7 +43,8 @@ class WaveCatalog:
     by filename or parameter string. When it is accessed with
     :py:meth:`~object.__getitem__`, the string is replaced by the actual
     wavelengths array. If filename is given, it is parsed with
-    :func:`stsynphot.stio.read_waveset`.
+    :func:`stsynphot.stio.read_waveset`. Loaded wavelength sets are
+    cached by their filename or parameter string.
 
     Parameters
     ----------
@@ -77,6 +78,7 @@ class WaveCatalog:
         self.wave_unit = units.validate_wave_unit(wave_unit)
         self.lookup = {}
         self.setlookup = {}
+        self._wavesets = {}  # Cache previously loaded wavelength sets
 
         for line in data:
             obm = line['OBSMODE']
@@ -167,15 +169,23 @@ class WaveCatalog:
 
         waveset : `astropy.units.quantity.Quantity`
             Corresponding wavelength set.
+            This is a copy of the cached wavelength set.
 
         """
         par = self.__getitem__(obsmode)
-        if par.startswith('('):
-            waveset = self._waveset_from_parstring(par)
+
+        # Load and cache waveset, if not in cache
+        if par in self._wavesets:
+            waveset = self._wavesets[par]
         else:
-            waveset = stio.read_waveset(
-                stio.irafconvert(par), wave_unit=self.wave_unit)
-        return par, waveset
+            if par.startswith('('):
+                waveset = self._waveset_from_parstring(par)
+            else:
+                waveset = stio.read_waveset(
+                    stio.irafconvert(par), wave_unit=self.wave_unit)
+            self._wavesets[par] = waveset
+
+        return par, waveset.copy()
 
 
 def load_wavecat(wave_unit=u.AA):